@@ -1,7 +1,10 @@
 # engine/llm.py
 
 import os
-from typing import Optional
+import threading
+import time
+from contextlib import nullcontext
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
 
 from openai import OpenAI
 
@@ -11,54 +14,157 @@ class LLMNotConfigured(Exception):
     pass
 
 
-def _get_client() -> OpenAI:
+class _TokenBucket:
     """
-    Returns an OpenAI client, or raises LLMNotConfigured if the API key is missing.
+    Minimal thread-safe token bucket refilled continuously over one minute.
+    Used to stay under OpenAI's per-minute request / token limits instead of
+    running into 429 back-off.
     """
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        # Streamlit Cloud: you probably set this in Secrets.
-        raise LLMNotConfigured(
-            "AI analysis is not configured yet. Please add OPENAI_API_KEY "
-            "to your Streamlit secrets or environment."
-        )
-    return OpenAI(api_key=api_key)
 
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
 
-def generate_ai_analysis(
-    problem: str,
-    domain: str,
-    rule_based_summary: str,
-    model: str = "gpt-4.1-mini",
-    temperature: float = 0.2,
-    max_tokens: int = 1400,
-) -> str:
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, amount: float) -> float:
+        """
+        Block until `amount` is available and debit it. Requests larger than
+        the bucket are capped at its capacity; returns the amount actually
+        debited, which is what release() must be settled against.
+        """
+        amount = min(float(amount), self.capacity)
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return amount
+                wait = (amount - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def release(self, amount: float) -> None:
+        """
+        Hand back unused capacity, or debit extra usage when amount is
+        negative. The balance may go below zero; later acquires then wait.
+        """
+        if amount == 0:
+            return
+        with self.lock:
+            self._refill()
+            self.tokens = min(self.capacity, self.tokens + amount)
+
+
+_Limiter = TypeVar("_Limiter")
+
+_LIMITERS: Dict[Tuple[str, int], object] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def _limiter_from_env(name: str, factory: Callable[[int], _Limiter]) -> Optional[_Limiter]:
     """
-    Call OpenAI to generate a consulting-style deep-dive brief.
+    Return the limiter configured by env var `name`, or None if unset.
+    Read per call (like OPENAI_API_KEY) so values loaded after import, e.g.
+    by load_dotenv() or Streamlit secrets, still apply.
+    """
+    value = os.getenv(name, "").strip()
+    if not value.isdigit() or int(value) <= 0:
+        return None
+    key = (name, int(value))
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(key)
+        if limiter is None:
+            limiter = _LIMITERS[key] = factory(int(value))
+    return limiter
 
-    Returns a markdown string ready to render with st.markdown().
-    Raises LLMNotConfigured if the API key is missing.
-    Propagates other exceptions to be handled in app.py.
+
+# Optional client-side throttling, e.g. OPENAI_RPM=500, OPENAI_TPM=200000,
+# OPENAI_MAX_CONCURRENCY=4. Unset means no limit.
+def _request_bucket() -> Optional[_TokenBucket]:
+    return _limiter_from_env("OPENAI_RPM", _TokenBucket)
+
+
+def _token_bucket() -> Optional[_TokenBucket]:
+    return _limiter_from_env("OPENAI_TPM", _TokenBucket)
+
+
+def _concurrency_limit() -> Optional[threading.BoundedSemaphore]:
+    return _limiter_from_env("OPENAI_MAX_CONCURRENCY", threading.BoundedSemaphore)
+
+
+def _estimate_tokens(messages: List[Dict[str, str]], max_tokens: int) -> int:
     """
-    client = _get_client()
+    Rough upper bound for a chat call: ~4 characters per prompt token plus
+    the full completion allowance.
+    """
+    prompt_chars = sum(len(m["content"]) for m in messages)
+    return prompt_chars // 4 + max_tokens
+
+
+def _call_openai(
+    client: OpenAI,
+    *,
+    messages: List[Dict[str, str]],
+    max_tokens: int,
+    **kwargs,
+):
+    """
+    Send a chat completion, reserving capacity from the rate limiters first.
+    Once the real usage is known the token reservation is settled against it;
+    if the call fails (or reports no usage) the reservation is refunded.
+    """
+    request_bucket = _request_bucket()
+    token_bucket = _token_bucket()
+    concurrency = _concurrency_limit()
+
+    if request_bucket is not None:
+        request_bucket.acquire(1)
+
+    reserved = 0.0
+    if token_bucket is not None:
+        reserved = token_bucket.acquire(_estimate_tokens(messages, max_tokens))
+
+    used = None
+    try:
+        with concurrency if concurrency is not None else nullcontext():
+            response = client.chat.completions.create(
+                messages=messages,
+                max_tokens=max_tokens,
+                **kwargs,
+            )
+        usage = getattr(response, "usage", None)
+        used = getattr(usage, "total_tokens", None) if usage is not None else None
+    finally:
+        if token_bucket is not None:
+            token_bucket.release(reserved - used if used is not None else reserved)
+
+    return response
 
-    # System message: how the AI should behave
-    system_msg = (
-        "You are a senior finance transformation consultant (Big-4 / Gartner style). "
-        "Write concise but high-quality consulting briefs for CFOs and Finance leaders. "
-        "Your tone is practical, structured and non-fluffy. "
-        "Always organize output under clearly numbered headings."
-    )
 
-    # User message: concrete task
-    user_prompt = f"""
+# System message: how the AI should behave
+_SYSTEM_MSG = (
+    "You are a senior finance transformation consultant (Big-4 / Gartner style). "
+    "Write concise but high-quality consulting briefs for CFOs and Finance leaders. "
+    "Your tone is practical, structured and non-fluffy. "
+    "Always organize output under clearly numbered headings."
+)
+
+
+# User message: concrete task. Filled in with str.format() per call.
+_USER_PROMPT_TMPL = """
 You are helping a CFO diagnose and solve a **{domain}** challenge.
 
 ### Original problem (verbatim from client)
-\"\"\"{problem.strip()}\"\"\"
+\"\"\"{problem}\"\"\"
 
 ### Rule-based summary from an internal diagnostic engine
-{rule_based_summary.strip()}
+{rule_based_summary}
 
 ### Task
 Write a 1-page consulting brief in markdown with the following structure and headings:
@@ -94,12 +200,51 @@ Avoid repeating the headings inside the bullets (no **Context:** etc inside bull
 Do NOT include any extra sections outside 1–7.
 """
 
-    response = client.chat.completions.create(
+
+def _get_client() -> OpenAI:
+    """
+    Returns an OpenAI client, or raises LLMNotConfigured if the API key is missing.
+    """
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        # Streamlit Cloud: you probably set this in Secrets.
+        raise LLMNotConfigured(
+            "AI analysis is not configured yet. Please add OPENAI_API_KEY "
+            "to your Streamlit secrets or environment."
+        )
+    return OpenAI(api_key=api_key)
+
+
+def generate_ai_analysis(
+    problem: str,
+    domain: str,
+    rule_based_summary: str,
+    model: str = "gpt-4.1-mini",
+    temperature: float = 0.2,
+    max_tokens: int = 1400,
+) -> str:
+    """
+    Call OpenAI to generate a consulting-style deep-dive brief.
+
+    Returns a markdown string ready to render with st.markdown().
+    Raises LLMNotConfigured if the API key is missing.
+    Propagates other exceptions to be handled in app.py.
+    """
+    client = _get_client()
+
+    user_prompt = _USER_PROMPT_TMPL.format(
+        domain=domain,
+        problem=problem.strip(),
+        rule_based_summary=rule_based_summary.strip(),
+    )
+
+    response = _call_openai(
+        client,
         model=model,
         temperature=temperature,
         max_tokens=max_tokens,
         messages=[
-            {"role": "system", "content": system_msg},
+            {"role": "system", "content": _SYSTEM_MSG},
             {"role": "user", "content": user_prompt},
         ],
     )
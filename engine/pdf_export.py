@@ -3,100 +3,196 @@
 from __future__ import annotations
 
 import os
+import re
+from functools import lru_cache
 from io import BytesIO
-from typing import Optional, List, Tuple
-
-from PIL import Image, ImageDraw, ImageFont
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from PIL import Image
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import inch, mm
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfgen import canvas
+from reportlab.platypus import KeepInFrame, Paragraph
 
 # ---------- PAGE GEOMETRY ----------
-# A4-ish at 150 dpi
-PAGE_WIDTH = 1654
-PAGE_HEIGHT = 2339
+# A4 in PDF points; origin is the bottom-left corner of the page
+PAGE_WIDTH, PAGE_HEIGHT = A4
+
+HEADER_HEIGHT = 33 * mm
+MARGIN = 10 * mm
+COLUMN_GAP = 5 * mm
+SECTION_GAP = 10 * mm   # banner -> columns -> benefits strip
+
+CARD_WIDTH = 66 * mm
+CARD_HEIGHT = 25 * mm
+CARD_X = PAGE_WIDTH - MARGIN - CARD_WIDTH
+CARD_Y = PAGE_HEIGHT - HEADER_HEIGHT + (HEADER_HEIGHT - CARD_HEIGHT) / 2
+CARD_RADIUS = 3 * mm
+CARD_TEXT_X = CARD_X + 3 * mm
+CARD_TEXT_Y = CARD_Y + CARD_HEIGHT - 7 * mm
+CARD_TITLE_LEADING = 7 * mm
+CARD_LINE_LEADING = 5 * mm
+
+LOGO_HEIGHT = 12 * mm
+LOGO_MAX_WIDTH = 60 * mm
+LOGO_X = 5 * mm
+LOGO_Y = PAGE_HEIGHT - HEADER_HEIGHT + (HEADER_HEIGHT - LOGO_HEIGHT) / 2
+LOGO_DPI = 300          # pixel density the embedded logo is downscaled to
+LOGO_TARGET_PX = round(LOGO_HEIGHT / inch * LOGO_DPI)
+
+# Colors – parsed once here rather than on every setFillColor call
+HEADER_BG = colors.HexColor("#003A70")   # dark blue
+HEADER_TEXT = colors.HexColor("#FFFFFF")
+TITLE_BLUE = colors.HexColor("#003966")
+BENEFIT_GREEN = colors.HexColor("#00A96D")
+
+# Standard PDF fonts – always available, nothing to embed or load
+FONT_REGULAR = "Helvetica"
+FONT_BOLD = "Helvetica-Bold"
+
+
+def _make_styles() -> Dict[str, ParagraphStyle]:
+    """
+    Paragraph styles used on the page. Built once at import time.
+    """
+    return {
+        "body": ParagraphStyle(
+            "body",
+            fontName=FONT_REGULAR,
+            fontSize=9,
+            leading=11.5,
+        ),
+        "benefit": ParagraphStyle(
+            "benefit",
+            fontName=FONT_REGULAR,
+            fontSize=8,
+            leading=10,
+        ),
+    }
+
+
+_STYLES = _make_styles()
+
 
-HEADER_HEIGHT = 260
-MARGIN = 80
-COLUMN_GAP = 40
+# ---------- TEXT HELPERS ----------
 
-# Colors
-HEADER_BG = "#003A70"   # dark blue
-HEADER_TEXT = "#FFFFFF"
-TITLE_BLUE = "#003966"
-BENEFIT_GREEN = "#00A96D"
+# Markdown the rule engine / LLM emits, matched in a single pass:
+#   "## Heading" -> "Heading", "- item" / "* item" -> "• item", "**bold**" -> "bold"
+# Headings need a space after the #s and bold needs a closing pair, so text
+# like "#1 priority" or "__init__" is left alone.
+_MD_RE = re.compile(
+    r"^[ \t]*(?:(?P<heading>#+)(?:[ \t]+|$)|[*-][ \t]+)"
+    r"|\*\*(?P<bold>\S(?:.*?\S)?)\*\*",
+    re.MULTILINE,
+)
 
 
-# ---------- FONT HELPERS ----------
+def _md_replacement(match: re.Match) -> str:
+    if match.group("bold") is not None:
+        return match.group("bold")
+    if match.group("heading"):
+        return ""
+    return "• "
 
-def _load_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+
+@lru_cache(maxsize=256)
+def _clean_markdown(text: str) -> str:
     """
-    Try to load a decent TTF font; fall back to default if not available.
+    Strip the markdown the rule engine / LLM emits (headings, bullets, bold)
+    so the PDF shows plain text. Cached because the same brief is usually
+    exported more than once.
     """
-    for name in ["DejaVuSans.ttf", "Arial.ttf", "Helvetica.ttf"]:
-        try:
-            return ImageFont.truetype(name, size)
-        except Exception:
-            continue
-    return ImageFont.load_default()
+    if not text or text.isspace():
+        return ""
+    return _MD_RE.sub(_md_replacement, text).strip()
 
 
-def _wrap_text(
+def _draw_paragraph(
+    c: canvas.Canvas,
     text: str,
-    font: ImageFont.ImageFont,
-    max_width: int,
-    draw: ImageDraw.ImageDraw,
-) -> List[str]:
+    x: float,
+    y: float,
+    width: float,
+    style: ParagraphStyle,
+    max_height: Optional[float] = None,
+) -> float:
     """
-    Simple word-wrap helper.
+    Draw a wrapped paragraph whose top edge sits at y and return the
+    y position of its bottom edge. Line breaks in text are kept; with
+    max_height the text is shrunk to fit instead of running off the page.
     """
-    words = text.split()
-    if not words:
-        return []
+    if not text or text.isspace():
+        return y
 
-    lines: List[str] = []
-    current: List[str] = []
+    body_xml = escape(text.strip()).replace("\n", "<br/>")
+    flowable = Paragraph(body_xml, style)
+    if max_height is not None:
+        flowable = KeepInFrame(width, max_height, content=[flowable], mode="shrink")
+    avail_height = max_height if max_height is not None else PAGE_HEIGHT
+    _, height = flowable.wrapOn(c, width, avail_height)
+    flowable.drawOn(c, x, y - height)
+    return y - height
 
-    for w in words:
-        test_line = " ".join(current + [w])
-        w_width, _ = draw.textsize(test_line, font=font)
-        if w_width <= max_width:
-            current.append(w)
-        else:
-            if current:
-                lines.append(" ".join(current))
-            current = [w]
-
-    if current:
-        lines.append(" ".join(current))
-    return lines
 
+# ---------- HEADER (LOGO + COMPANY PROFILE CARD) ----------
 
-def _draw_paragraph(
-    draw: ImageDraw.ImageDraw,
-    text: str,
-    x: int,
-    y: int,
-    width: int,
-    font: ImageFont.ImageFont,
-    fill: str = "black",
-    line_spacing: int = 4,
-) -> int:
+def _logo_mtime(logo_path: Optional[str]) -> Optional[float]:
     """
-    Draw a wrapped paragraph and return the new y position after the block.
+    Modification time of the logo file, or None if there is no usable file.
     """
-    lines = _wrap_text(text, font, width, draw)
-    line_height = font.getsize("Ag")[1]
-
-    for line in lines:
-        draw.text((x, y), line, font=font, fill=fill)
-        y += line_height + line_spacing
+    if not logo_path:
+        return None
+    try:
+        return os.path.getmtime(logo_path)
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=8)
+def _logo_reader(
+    logo_path: str, mtime: float, target_h: int
+) -> Optional[ImageReader]:
+    """
+    Decode the logo once and downscale it to target_h pixels high, so every
+    PDF embeds a small image instead of the full-resolution source file.
+    mtime is only part of the cache key: replacing the file invalidates it.
 
-    return y
+    An unreadable logo is cached as None, so a broken file costs one failed
+    decode per process instead of one per PDF.
+    """
+    try:
+        logo = Image.open(logo_path)
+        logo.load()
+    except Exception:
+        return None
+    if logo.mode != "RGBA":
+        logo = logo.convert("RGBA")
+    scale = min(target_h / logo.height, 1.0)
+    if scale < 1.0:
+        new_w = max(1, round(logo.width * scale))
+        new_h = max(1, round(logo.height * scale))
+        logo = logo.resize((new_w, new_h), Image.Resampling.BILINEAR)
+    return ImageReader(logo)
+
+
+def _draw_banner_background(c: canvas.Canvas) -> None:
+    """
+    Static part of the banner: the dark-blue bar and the empty white
+    Company Profile card.
+    """
+    c.setFillColor(HEADER_BG)
+    c.rect(0, PAGE_HEIGHT - HEADER_HEIGHT, PAGE_WIDTH, HEADER_HEIGHT, stroke=0, fill=1)
 
+    c.setFillColor(colors.white)
+    c.roundRect(CARD_X, CARD_Y, CARD_WIDTH, CARD_HEIGHT, CARD_RADIUS, stroke=0, fill=1)
 
-# ---------- HEADER (LOGO + COMPANY PROFILE CARD) ----------
 
 def _draw_top_banner(
-    img: Image.Image,
-    draw: ImageDraw.ImageDraw,
+    c: canvas.Canvas,
     logo_path: Optional[str],
     company_name: str,
     industry: Optional[str],
@@ -107,233 +203,241 @@ def _draw_top_banner(
       - Company Profile card on the right
     No "Bivenue Copilot" text in the header.
     """
-    # background bar
-    draw.rectangle([0, 0, PAGE_WIDTH, HEADER_HEIGHT], fill=HEADER_BG)
-
-    # --- Left: logo (if provided) ---
-    if logo_path and os.path.exists(logo_path):
-        try:
-            logo = Image.open(logo_path).convert("RGBA")
-            max_logo_height = 90
-            scale = min(max_logo_height / logo.height, 1.0)
-            new_w = int(logo.width * scale)
-            new_h = int(logo.height * scale)
-            logo = logo.resize((new_w, new_h), Image.LANCZOS)
-
-            pad_x = 40
-            logo_x = pad_x
-            logo_y = (HEADER_HEIGHT - new_h) // 2
-            img.paste(logo, (logo_x, logo_y), logo)
-        except Exception:
-            # Fail silently – header will just be text/card
-            pass
-
-    # --- Right: Company Profile card ---
-    card_width = 520
-    card_height = 200
-    card_x = PAGE_WIDTH - MARGIN - card_width
-    card_y = HEADER_HEIGHT // 2 - card_height // 2
-
-    draw.rounded_rectangle(
-        [(card_x, card_y), (card_x + card_width, card_y + card_height)],
-        radius=25,
-        fill="white",
-    )
+    # background bar + card, recorded once per document
+    c.doForm(_BANNER_FORM)
+
+    # --- Left: logo (if provided and readable; otherwise just the card) ---
+    logo = None
+    mtime = _logo_mtime(logo_path)
+    if mtime is not None:
+        logo = _logo_reader(logo_path, mtime, LOGO_TARGET_PX)
+    if logo is not None:
+        # Exact placement from the (already downscaled) pixel size, so
+        # ReportLab has no aspect-ratio fitting to do per page
+        img_w, img_h = logo.getSize()
+        scale = min(LOGO_HEIGHT / img_h, LOGO_MAX_WIDTH / img_w)
+        draw_w, draw_h = img_w * scale, img_h * scale
+        c.drawImage(
+            logo,
+            LOGO_X,
+            LOGO_Y + (LOGO_HEIGHT - draw_h) / 2,
+            width=draw_w,
+            height=draw_h,
+            mask="auto",
+        )
 
-    title_font = _load_font(32)
-    body_font = _load_font(24)
+    # --- Right: Company Profile card text ---
+    # One text object for the whole card: a single BT/ET block in the PDF
+    text = c.beginText(CARD_TEXT_X, CARD_TEXT_Y)
+    text.setFillColor(TITLE_BLUE)
+    text.setFont(FONT_BOLD, 12, leading=CARD_TITLE_LEADING)
+    text.textLine("Company Profile")
 
-    draw.text(
-        (card_x + 24, card_y + 18),
-        "Company Profile",
-        font=title_font,
-        fill=TITLE_BLUE,
-    )
-
-    y = card_y + 70
-    draw.text(
-        (card_x + 24, y),
-        f"Name: {company_name}",
-        font=body_font,
-        fill="black",
-    )
-    y += 36
+    text.setFillColor(colors.black)
+    text.setFont(FONT_REGULAR, 9, leading=CARD_LINE_LEADING)
+    text.textLine(f"Name: {company_name}")
     if industry:
-        draw.text(
-            (card_x + 24, y),
-            f"Industry: {industry}",
-            font=body_font,
-            fill="black",
-        )
+        text.textLine(f"Industry: {industry}")
+    c.drawText(text)
 
 
 # ---------- THREE CONSULTING COLUMNS ----------
 
+COLUMNS_TOP = PAGE_HEIGHT - HEADER_HEIGHT - SECTION_GAP
+COLUMN_WIDTH = (PAGE_WIDTH - 2 * MARGIN - 2 * COLUMN_GAP) / 3
+COLUMN_XS = tuple(MARGIN + i * (COLUMN_WIDTH + COLUMN_GAP) for i in range(3))
+COLUMN_HEADING_Y = COLUMNS_TOP - 10
+COLUMN_BODY_TOP = COLUMNS_TOP - 6.5 * mm
+COLUMN_BODY_HEIGHT = COLUMN_BODY_TOP - MARGIN
+
+
 def _draw_consulting_columns(
-    draw: ImageDraw.ImageDraw,
+    c: canvas.Canvas,
     challenge: str,
     domain: str,
     rule_based_summary: str,
     ai_brief: str,
-) -> int:
+) -> float:
     """
     Three-column layout:
       1) Mission-critical priority
       2) How Bivenue helped
       3) Outcome & AI deep-dive insights
 
-    Returns the y position after this block, so we can draw benefits below.
+    Returns the y position below this block, so we can draw benefits under it.
     """
-    heading_font = _load_font(30)
-    body_font = _load_font(24)
-
-    top_y = HEADER_HEIGHT + 80
-    usable_width = PAGE_WIDTH - 2 * MARGIN
-    col_width = (usable_width - 2 * COLUMN_GAP) // 3
-
-    col1_x = MARGIN
-    col2_x = col1_x + col_width + COLUMN_GAP
-    col3_x = col2_x + col_width + COLUMN_GAP
-
-    # --- Column 1: Mission-critical priority ---
-    draw.text(
-        (col1_x, top_y),
-        "Mission-critical priority",
-        font=heading_font,
-        fill=TITLE_BLUE,
-    )
-    y1 = top_y + 50
-    mission_text = f"Mission-critical priority: {domain or 'Finance'}"
-    y1 = _draw_paragraph(draw, mission_text, col1_x, y1, col_width, body_font)
-
-    # --- Column 2: How Bivenue helped ---
-    draw.text(
-        (col2_x, top_y),
-        "How Bivenue helped",
-        font=heading_font,
-        fill=TITLE_BLUE,
-    )
-    y2 = top_y + 50
-    how_text = rule_based_summary or "Summary of recommended focus areas & actions."
-    y2 = _draw_paragraph(draw, how_text, col2_x, y2, col_width, body_font)
-
-    # --- Column 3: Outcome & AI deep-dive ---
-    draw.text(
-        (col3_x, top_y),
-        "Outcome & AI deep-dive insights",
-        font=heading_font,
-        fill=TITLE_BLUE,
+    body_style = _STYLES["body"]
+
+    columns = (
+        (
+            "Mission-critical priority",
+            f"Mission-critical priority: {domain or 'Finance'}",
+        ),
+        (
+            "How Bivenue helped",
+            _clean_markdown(rule_based_summary)
+            or "Summary of recommended focus areas & actions.",
+        ),
+        (
+            "Outcome & AI deep-dive insights",
+            _clean_markdown(ai_brief) or "AI analysis could not be generated.",
+        ),
     )
-    y3 = top_y + 50
-    outcome_text = ai_brief or "AI analysis could not be generated."
-    y3 = _draw_paragraph(draw, outcome_text, col3_x, y3, col_width, body_font)
+    # Headings share one font and colour, so set them once for all three
+    c.setFillColor(TITLE_BLUE)
+    c.setFont(FONT_BOLD, 10)
+    for col_x, (heading, _) in zip(COLUMN_XS, columns):
+        c.drawString(col_x, COLUMN_HEADING_Y, heading)
 
-    return max(y1, y2, y3)
+    bottoms = [
+        _draw_paragraph(
+            c, body, col_x, COLUMN_BODY_TOP, COLUMN_WIDTH, body_style, COLUMN_BODY_HEIGHT
+        )
+        for col_x, (_, body) in zip(COLUMN_XS, columns)
+    ]
+    return min(bottoms)
 
 
 # ---------- BCG-STYLE BENEFIT STRIP ----------
 
-def _draw_benefits_strip(
-    draw: ImageDraw.ImageDraw,
-    top_y: int,
+_BENEFITS: Tuple[Tuple[str, str], ...] = (
+    (
+        "Leading by example",
+        "Finance sets the tone for change by role-modelling new ways of working.",
+    ),
+    (
+        "Improved decisions",
+        "Cleaner data, standard reports and analytics support faster decisions.",
+    ),
+    (
+        "Smarter resources",
+        "Capacity is redirected from manual work to higher-value analysis.",
+    ),
+    (
+        "More meaningful work",
+        "Teams focus on business impact rather than repetitive reconciliations.",
+    ),
+    (
+        "Future-ready finance",
+        "Digital tools and AI build skills needed for the next wave of change.",
+    ),
+)
+
+BENEFIT_BOX_GAP = 2.5 * mm
+BENEFIT_BOX_WIDTH = (
+    PAGE_WIDTH - 2 * MARGIN - BENEFIT_BOX_GAP * (len(_BENEFITS) - 1)
+) / len(_BENEFITS)
+BENEFIT_BOX_HEIGHT = 27 * mm
+
+
+def _draw_benefit_boxes(
+    c: canvas.Canvas,
+    top_y: float,
 ) -> None:
     """
     Draw a BCG-style horizontal benefits strip:
     5 rounded boxes with green accents and short text.
     """
-    heading_font = _load_font(26)
-    body_font = _load_font(22)
-
-    benefits: List[Tuple[str, str]] = [
-        (
-            "Leading by example",
-            "Finance sets the tone for change by role-modelling new ways of working.",
-        ),
-        (
-            "Improved decisions",
-            "Cleaner data, standard reports and analytics support faster decisions.",
-        ),
-        (
-            "Smarter resources",
-            "Capacity is redirected from manual work to higher-value analysis.",
-        ),
-        (
-            "More meaningful work",
-            "Teams focus on business impact rather than repetitive reconciliations.",
-        ),
-        (
-            "Future-ready finance",
-            "Digital tools and AI build skills needed for the next wave of change.",
-        ),
+    box_y = top_y - BENEFIT_BOX_HEIGHT
+    body_style = _STYLES["benefit"]
+    box_xs = [
+        MARGIN + i * (BENEFIT_BOX_WIDTH + BENEFIT_BOX_GAP) for i in range(len(_BENEFITS))
     ]
 
-    strip_left = MARGIN
-    strip_right = PAGE_WIDTH - MARGIN
-    total_width = strip_right - strip_left
-    box_gap = 20
-    box_width = (total_width - box_gap * (len(benefits) - 1)) // len(benefits)
-    box_height = 210
-
-    for i, (title, text) in enumerate(benefits):
-        x = strip_left + i * (box_width + box_gap)
-        y = top_y
-
-        draw.rounded_rectangle(
-            [(x, y), (x + box_width, y + box_height)],
-            radius=35,
-            outline=BENEFIT_GREEN,
-            width=3,
-            fill="white",
+    # Grouped by colour so each fill/stroke colour is set once:
+    # white boxes with green outline, then green titles, then black bodies.
+    c.setStrokeColor(BENEFIT_GREEN)
+    c.setLineWidth(1)
+    c.setFillColor(colors.white)
+    for x in box_xs:
+        c.roundRect(
+            x, box_y, BENEFIT_BOX_WIDTH, BENEFIT_BOX_HEIGHT, 4.5 * mm, stroke=1, fill=1
         )
 
-        draw.text(
-            (x + 18, y + 18),
-            title,
-            font=heading_font,
-            fill=BENEFIT_GREEN,
-        )
+    c.setFillColor(BENEFIT_GREEN)
+    c.setFont(FONT_BOLD, 8.5)
+    for x, (title, _) in zip(box_xs, _BENEFITS):
+        c.drawString(x + 2.5 * mm, top_y - 6 * mm, title)
 
-        body_y = y + 18 + 40
+    for x, (_, text) in zip(box_xs, _BENEFITS):
         _draw_paragraph(
-            draw,
+            c,
             text,
-            x + 18,
-            body_y,
-            box_width - 36,
-            body_font,
-            fill="black",
+            x + 2.5 * mm,
+            top_y - 8.5 * mm,
+            BENEFIT_BOX_WIDTH - 5 * mm,
+            body_style,
         )
 
 
+def _draw_benefits_strip(
+    c: canvas.Canvas,
+    top_y: float,
+) -> None:
+    """
+    Place the pre-recorded benefits strip with its top edge at top_y.
+    """
+    c.saveState()
+    c.translate(0, top_y)
+    c.doForm(_BENEFITS_FORM)
+    c.restoreState()
+
+
+# ---------- STATIC CHROME (PDF FORM XOBJECTS) ----------
+
+_BANNER_FORM = "bivBanner"
+_BENEFITS_FORM = "bivBenefits"
+
+
+def _ensure_chrome_forms(c: canvas.Canvas) -> None:
+    """
+    Record the content that is identical on every brief (banner background,
+    profile card, benefits strip) as form XObjects, once per document.
+    Pages then reference them with a single doForm instead of re-emitting
+    every rectangle and string, which keeps batch exports small.
+    """
+    if c.hasForm(_BANNER_FORM):
+        return
+
+    c.beginForm(_BANNER_FORM)
+    _draw_banner_background(c)
+    c.endForm()
+
+    # Drawn with its top edge at y=0; bbox padded for the box outlines
+    c.beginForm(
+        _BENEFITS_FORM,
+        lowerx=0,
+        lowery=-BENEFIT_BOX_HEIGHT - 2,
+        upperx=PAGE_WIDTH,
+        uppery=2,
+    )
+    _draw_benefit_boxes(c, 0)
+    c.endForm()
+
+
 # ---------- PUBLIC ENTRY POINT ----------
 
-def create_consulting_brief_pdf(
+def _draw_brief_page(
+    c: canvas.Canvas,
     logo_path: Optional[str],
     domain: str,
     challenge: str,
     rule_based_summary: str,
     ai_brief: str,
-    company_name: str = "Client",
-    industry: Optional[str] = "Finance",
-    revenue: Optional[str] = None,      # kept for future use
-    employees: Optional[str] = None,    # kept for future use
-) -> bytes:
+    company_name: str,
+    industry: Optional[str],
+) -> None:
     """
-    Create a one-page PDF consulting brief with:
-      - Top banner (logo + company profile)
-      - 3 consulting columns
-      - BCG-style benefits strip at the bottom
+    Draw one consulting brief onto the current canvas page.
     """
-    # Base image
-    img = Image.new("RGB", (PAGE_WIDTH, PAGE_HEIGHT), "white")
-    draw = ImageDraw.Draw(img)
+    _ensure_chrome_forms(c)
 
     # Header banner (logo only + company profile)
-    _draw_top_banner(img, draw, logo_path, company_name, industry)
+    _draw_top_banner(c, logo_path, company_name, industry)
 
     # Consulting content columns
     bottom_y = _draw_consulting_columns(
-        draw=draw,
+        c=c,
         challenge=challenge,
         domain=domain,
         rule_based_summary=rule_based_summary,
@@ -341,11 +445,115 @@ def create_consulting_brief_pdf(
     )
 
     # Benefits strip (BCG-style flow) if there's room
-    benefits_top = bottom_y + 80
-    if benefits_top + 220 < PAGE_HEIGHT - 80:
-        _draw_benefits_strip(draw, benefits_top)
+    benefits_top = bottom_y - SECTION_GAP
+    if benefits_top - BENEFIT_BOX_HEIGHT - 1 * mm > MARGIN:
+        _draw_benefits_strip(c, benefits_top)
+
 
-    # Export to PDF
+@lru_cache(maxsize=16)
+def _build_pdf_bytes(
+    logo_path: Optional[str],
+    logo_mtime: Optional[float],
+    domain: str,
+    challenge: str,
+    rule_based_summary: str,
+    ai_brief: str,
+    company_name: str,
+    industry: Optional[str],
+) -> bytes:
+    """
+    Render the brief to PDF bytes. Memoized on the (hashable) inputs because
+    Streamlit reruns regenerate the same brief on every widget interaction;
+    logo_mtime is only part of the cache key.
+    """
     output = BytesIO()
-    img.save(output, format="PDF")
+    c = canvas.Canvas(output, pagesize=A4, pageCompression=1)
+    _draw_brief_page(
+        c,
+        logo_path,
+        domain,
+        challenge,
+        rule_based_summary,
+        ai_brief,
+        company_name,
+        industry,
+    )
+    c.showPage()
+    c.save()
+    return output.getvalue()
+
+
+def create_consulting_brief_pdf(
+    logo_path: Optional[str],
+    domain: str,
+    challenge: str,
+    rule_based_summary: str,
+    ai_brief: str,
+    company_name: str = "Client",
+    industry: Optional[str] = "Finance",
+    revenue: Optional[str] = None,      # kept for future use
+    employees: Optional[str] = None,    # kept for future use
+    out: Optional[BinaryIO] = None,
+) -> Optional[bytes]:
+    """
+    Create a one-page vector PDF consulting brief with:
+      - Top banner (logo + company profile)
+      - 3 consulting columns
+      - BCG-style benefits strip at the bottom
+
+    If out is given the PDF is written into that file object and None is
+    returned; otherwise the PDF bytes are returned.
+    """
+    pdf = _build_pdf_bytes(
+        logo_path,
+        _logo_mtime(logo_path),
+        domain,
+        challenge,
+        rule_based_summary,
+        ai_brief,
+        company_name,
+        industry,
+    )
+    if out is not None:
+        out.write(pdf)
+        return None
+    return pdf
+
+
+def create_consulting_briefs_pdf_batch(
+    briefs: List[Dict[str, Any]],
+    out: Optional[BinaryIO] = None,
+) -> Optional[bytes]:
+    """
+    Render several briefs into one multi-page PDF, one brief per page.
+    All pages share a single canvas, so fonts and the embedded logo are
+    written once instead of once per brief.
+
+    Each item takes the same keys as create_consulting_brief_pdf's
+    arguments: logo_path, domain, challenge, rule_based_summary, ai_brief
+    and optionally company_name / industry.
+    Raises ValueError if briefs is empty (a 0-page PDF is not valid).
+    """
+    if not briefs:
+        raise ValueError("briefs must contain at least one brief.")
+
+    output = out if out is not None else BytesIO()
+    c = canvas.Canvas(output, pagesize=A4, pageCompression=1)
+
+    for brief in briefs:
+        _draw_brief_page(
+            c,
+            brief.get("logo_path"),
+            brief["domain"],
+            brief["challenge"],
+            brief["rule_based_summary"],
+            brief["ai_brief"],
+            brief.get("company_name", "Client"),
+            brief.get("industry", "Finance"),
+        )
+        c.showPage()
+
+    c.save()
+    if out is not None:
+        return None
     return output.getvalue()